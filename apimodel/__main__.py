@@ -42,8 +42,7 @@ def main() -> None:
     args = parser.parse_args()
 
     data = json.load(args.input or sys.stdin)
-    code = generator.generate_models(data, python=args.python)
-    args.output.write(code)
+    args.output.writelines(generator.generate_models_iter(data, python=args.python))
 
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
 """APIModel class with all the validation."""
 from __future__ import annotations
 
+import collections.abc
+import datetime
+import operator
 import typing
 
 from . import errors, fields, tutils, utility, validation
@@ -20,14 +23,113 @@ def _serialize_attr(attr: object, **kwargs: object) -> object:
     """Serialize an attribute."""
     if isinstance(attr, APIModel):
         return attr.as_dict(**kwargs)
-    if tutils.generic_isinstance(attr, typing.Mapping[object, object]):
+    if isinstance(attr, collections.abc.Mapping):
         return {_serialize_attr(k, **kwargs): _serialize_attr(v, **kwargs) for k, v in attr.items()}
-    if tutils.generic_isinstance(attr, typing.Sequence[object], exclude=str):
+    if isinstance(attr, collections.abc.Sequence) and not isinstance(attr, str):
         return [_serialize_attr(x, **kwargs) for x in attr]
 
     return attr
 
 
+def _serialize_model(attr: object, **kwargs: object) -> object:
+    """Serialize an attribute declared as a model."""
+    if isinstance(attr, APIModel):
+        return attr.as_dict(**kwargs)
+
+    return _serialize_attr(attr, **kwargs)
+
+
+Serializer = typing.Callable[..., object]
+ValuesGetter = typing.Callable[[object], typing.Sequence[object]]
+
+# types serialized as-is, bytes are serialized as a list of integers like any other sequence
+_SCALAR_TYPES: typing.Sequence[object] = (
+    str,
+    int,
+    float,
+    bool,
+    datetime.datetime,
+    datetime.date,
+    datetime.timedelta,
+)
+
+
+def _get_field_type(field: fields.ModelFieldInfo) -> typing.Optional[object]:
+    """Get the type every value of a field is validated into.
+
+    Return None if the values of the field may be anything.
+    """
+    # post-validators may return anything
+    if any(validator.order >= validation.Order.POST_VALIDATOR for validator in field.validators):
+        return None
+
+    try:
+        return field.annotation_validator.tp
+    except StopIteration:
+        return None
+
+
+def _resolve_serializer(field: fields.ModelFieldInfo) -> typing.Optional[Serializer]:
+    """Resolve the serializer of a field from its declared type.
+
+    Return None if the values of the field do not need to be serialized.
+    """
+    tp = _get_field_type(field)
+    if tp is None:
+        return _serialize_attr
+
+    if tp in _SCALAR_TYPES:
+        return None
+    if tutils.lenient_issubclass(tp, APIModel):
+        return _serialize_model
+
+    return _serialize_attr
+
+
+def _make_values_getter(names: typing.Sequence[str]) -> ValuesGetter:
+    """Make a getter returning the values of all the attributes at once."""
+    if not names:
+        return lambda obj: ()
+
+    if len(names) == 1:
+        getter = operator.attrgetter(names[0])
+        return lambda obj: (getter(obj),)
+
+    return operator.attrgetter(*names)
+
+
+class FieldsPlan:
+    """Flattened fields serialized by `APIModel.as_dict`."""
+
+    __slots__ = ("names", "aliases", "serializers", "get_values")
+
+    names: typing.Tuple[str, ...]
+    """Attribute names of the fields."""
+
+    aliases: typing.Tuple[str, ...]
+    """Aliases of the fields."""
+
+    serializers: typing.Tuple[typing.Optional[Serializer], ...]
+    """Serializers resolved for the fields. None if the value is used as-is."""
+
+    get_values: ValuesGetter
+    """Getter for the values of all the fields in order."""
+
+    def __init__(self, items: typing.Sequence[typing.Tuple[str, fields.ModelFieldInfo]]) -> None:
+        """Initialize a FieldsPlan from ``(attr_name, field)`` items."""
+        self.names = tuple(name for name, _ in items)
+        self.aliases = tuple(field.alias for _, field in items)
+        self.serializers = tuple(_resolve_serializer(field) for _, field in items)
+        self.get_values = _make_values_getter(self.names)
+
+    def serialize(self, obj: object, **kwargs: object) -> typing.List[object]:
+        """Serialize the values of all the fields of an object."""
+        return [
+            value if serialize is None else serialize(value, **kwargs)
+            for serialize, value in zip(self.serializers, self.get_values(obj))
+        ]
+
+
 def _to_mapping(obj: object, **kwargs: object) -> typing.Mapping[str, object]:
     """Turn an arbitrary object into a mapping for APIModel."""
     if isinstance(obj, APIModel):
@@ -62,6 +164,12 @@ class APIModelMeta(type):
     __root_validators__: typing.Sequence[validation.RootValidator]
     """Root validators."""
 
+    __fields_plans__: typing.Optional[typing.Tuple[FieldsPlan, FieldsPlan]]
+    """Public fields plan and all fields plan. None until first used or after fields have been changed."""
+
+    _fields_plan_cls: typing.ClassVar[typing.Type[FieldsPlan]] = FieldsPlan
+    """Type of the plans built from fields."""
+
     def __new__(
         cls,
         name: str,
@@ -115,15 +223,41 @@ class APIModelMeta(type):
                 elif name[0] != "_":
                     self.__properties__[name] = name
 
-        self.__root_validators__.sort(key=lambda v: v.order)
+        self.__root_validators__.sort(key=operator.attrgetter("order"))
+        self.__fields_plans__ = None
 
         if slots and "__slots__" not in namespace:
             previous_slots = set(slot for base in bases for slot in utility.get_slots(base))
             all_slots = set((*self.__fields__.keys(), *self.__extras__.keys()))
             self.__slots__ = tuple(all_slots - previous_slots)
+            # the class already exists, forget slots looked up while it was being created
+            utility.forget_slots(self)
 
         return self
 
+    def _get_fields_plan(self, private: bool = False) -> FieldsPlan:
+        """Get the flattened fields to serialize."""
+        plans = self.__fields_plans__
+        if plans is None:
+            items = list(self.__fields__.items())
+            public = self._fields_plan_cls([item for item in items if not item[1].private])
+            self.__fields_plans__ = plans = (public, self._fields_plan_cls(items))
+
+            for _, field in items:
+                field._owners.add(self)
+
+        return plans[1 if private else 0]
+
+    def _forget_fields_plan(self) -> None:
+        """Forget the flattened fields after they have been changed."""
+        self.__fields_plans__ = None
+
+    def __setattr__(self, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        # fields may get replaced after the class has been created
+        if name == "__fields__":
+            self._forget_fields_plan()
+
     def __repr__(self) -> str:
         args = ", ".join(f"{k}={v!r}" for k, v in self.__fields__.items())
         return f"{self.__class__.__name__}({self.__name__!r}{f', {args}' if args else ''})"
@@ -269,6 +403,15 @@ class APIModel(utility.Representation, metaclass=APIModelMeta):
         if cls.isasync:
             raise TypeError("Must use the create method with an async APIModel.")
 
+        return cls._create_sync(obj, **kwargs)
+
+    @classmethod
+    def _create_sync(
+        cls: typing.Type[APIModelT],
+        obj: typing.Optional[object] = None,
+        **kwargs: object,
+    ) -> APIModelT:
+        """Create a new model instance of a model known to be synchronous."""
         if isinstance(obj, cls):
             return obj
 
@@ -313,16 +456,13 @@ class APIModel(utility.Representation, metaclass=APIModelMeta):
         """
         obj: typing.Mapping[str, object] = {}
 
-        for attr_name, field in self.__class__.__fields__.items():
-            if field.private and not private:
-                continue
-
-            field_name = field.alias if alias else attr_name
-            attr = getattr(self, attr_name)
-            obj[field_name] = _serialize_attr(attr, private=private, alias=alias)
+        plan = self.__class__._get_fields_plan(private)
+        for name, serialize, value in zip(plan.aliases if alias else plan.names, plan.serializers, plan.get_values(self)):
+            obj[name] = value if serialize is None else serialize(value, private=private, alias=alias)
 
         if properties:
-            obj.update({name: getattr(self, name) for name in self.__class__.__properties__})
+            for name in self.__class__.__properties__:
+                obj[name] = getattr(self, name)
 
         return obj
 
@@ -331,9 +471,9 @@ class APIModel(utility.Representation, metaclass=APIModelMeta):
         obj: typing.Mapping[str, object] = {}
 
         for attr_name, extra in self.__class__.__extras__.items():
-            field_name = extra.alias if alias else attr_name
-            if hasattr(self, attr_name):
-                obj[field_name] = getattr(self, attr_name)
+            value = getattr(self, attr_name, ...)
+            if value is not ...:
+                obj[extra.alias if alias else attr_name] = value
 
         return obj
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 import contextlib
 import typing
 
-from . import apimodel, tutils, utility
+from . import tutils, utility
 
 __all__ = ["LocError", "ValidationError", "catch_errors"]
 
@@ -43,20 +43,32 @@ class ValidationError(utility.Representation, ValueError):
     errors: typing.Sequence[LocError]
     """Collected errors."""
 
-    model: typing.Type[apimodel.APIModel]
-    """The model in which the error ocurred. Used for debugging."""
+    model: typing.Optional[type]
+    """The model or other type in which the error ocurred. Used for debugging."""
 
-    def __init__(self, *errors: ErrorList, model: typing.Type[apimodel.APIModel]) -> None:
-        """Initialize a ValidationError with a list of LocErrors."""
+    name: str
+    """Name of the validated type. The name of the model by default."""
+
+    def __init__(
+        self,
+        *errors: ErrorList,
+        model: typing.Optional[type] = None,
+        name: typing.Optional[str] = None,
+    ) -> None:
+        """Initialize a ValidationError with a list of LocErrors.
+
+        Values which are not validated into a type may only be given a name.
+        """
         self.errors = utility.flatten_sequences(*errors)
         self.model = model
+        self.name = name if name is not None else getattr(model, "__name__", "")
 
         super().__init__(self.errors)
 
     def __str__(self) -> str:
         errors = list(flatten_errors(self.errors))
         return (
-            f'{len(errors)} validation error{"" if len(errors) == 1 else "s"} for {self.model.__name__}\n'
+            f'{len(errors)} validation error{"" if len(errors) == 1 else "s"} for {self.name}\n'
             + "\n".join(f'{" -> ".join(map(str, loc))}\n  {error.__class__.__name__}: {error}' for loc, error in errors)
         )
 
@@ -89,18 +101,25 @@ def flatten_errors(
 class ErrorCatcher:
     """Catch errors and append to a list."""
 
-    __slots__ = ("errors", "model")
+    __slots__ = ("errors", "model", "name")
 
     errors: typing.MutableSequence[LocError]
-    model: typing.Type[apimodel.APIModel]
-
-    def __init__(self, model: tutils.MaybeType[apimodel.APIModel]) -> None:
+    model: typing.Optional[type]
+    name: typing.Optional[str]
+
+    def __init__(
+        self,
+        model: typing.Optional[tutils.MaybeType[object]] = None,
+        *,
+        name: typing.Optional[str] = None,
+    ) -> None:
         """Initialize an ErrorCatcher."""
-        if not isinstance(model, type):
+        if model is not None and not isinstance(model, type):
             model = type(model)
 
         self.errors = []
         self.model = model
+        self.name = name
 
     def add_error(self, error: Exception, loc: RawLoc) -> None:
         """Add an error to the list."""
@@ -120,11 +139,15 @@ class ErrorCatcher:
     def raise_errors(self) -> None:
         """Raise errors."""
         if self.errors:
-            raise ValidationError(self.errors, model=self.model)
+            raise ValidationError(self.errors, model=self.model, name=self.name)
 
 
 @contextlib.contextmanager
-def catch_errors(model: tutils.MaybeType[apimodel.APIModel]) -> typing.Iterator[ErrorCatcher]:
+def catch_errors(
+    model: typing.Optional[tutils.MaybeType[object]] = None,
+    *,
+    name: typing.Optional[str] = None,
+) -> typing.Iterator[ErrorCatcher]:
     """Catch errors and raise a ValidationError if at least one is present.
 
     Examples
@@ -134,10 +157,7 @@ def catch_errors(model: tutils.MaybeType[apimodel.APIModel]) -> typing.Iterator[
     >>>         with catcher.catch(loc=function.__name__):
     >>>             function()
     """
-    if not isinstance(model, type):
-        model = type(model)
-
-    catcher = ErrorCatcher(model)
+    catcher = ErrorCatcher(model, name=name)
     try:
         yield catcher
     finally:
@@ -1,7 +1,9 @@
 """Field descriptors."""
 from __future__ import annotations
 
+import operator
 import typing
+import weakref
 
 from . import parser, tutils, utility, validation
 
@@ -14,7 +16,7 @@ T = typing.TypeVar("T")
 class FieldInfo(utility.Representation):
     """Basic information about a field."""
 
-    __slots__ = ("default", "default_factory", "alias", "private", "validators", "extra")
+    __slots__ = ("default", "default_factory", "alias", "private", "validators", "extra", "_owners")
 
     default: object
     """The default value of the field."""
@@ -43,6 +45,9 @@ class FieldInfo(utility.Representation):
     May be used by subclasses to store additional information.
     """
 
+    _owners: weakref.WeakSet[typing.Any]
+    """Models which flattened the field for serialization and must forget it once the field changes."""
+
     def __init__(
         self,
         default: object = ...,
@@ -57,6 +62,7 @@ class FieldInfo(utility.Representation):
 
         Extra arguments may be repurposed for subclass attributes.
         """
+        self._owners = weakref.WeakSet()
         self.default = default
         self.default_factory = default_factory
         self.alias = alias
@@ -68,13 +74,22 @@ class FieldInfo(utility.Representation):
 
     def add_validators(self, *validators: typing.Union[validation.Validator, tutils.AnyCallable]) -> None:
         """Properly add validators to the field."""
-        for callback in validators:
-            if isinstance(callback, validation.Validator):
-                self.validators.append(callback)
-            else:
-                self.validators.append(validation.Validator(callback))
+        self.validators.extend(
+            callback if isinstance(callback, validation.Validator) else validation.Validator(callback)
+            for callback in validators
+        )
+        self.validators.sort(key=operator.attrgetter("order"))
+        self._forget_owners()
+
+    def _forget_owners(self) -> None:
+        """Make models forget the field after it has been changed."""
+        # subclasses may set attributes before initializing the field
+        for model in getattr(self, "_owners", ()):
+            model._forget_fields_plan()
 
-        self.validators.sort(key=lambda v: v.order)
+    def __setattr__(self, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        self._forget_owners()
 
     def _get_default(self) -> object:
         """Get the default value of the field.
@@ -90,11 +105,13 @@ class FieldInfo(utility.Representation):
 class ModelFieldInfo(FieldInfo):
     """Complete information about a field."""
 
-    __slots__ = ()
+    __slots__ = ("_annotation_validator",)
 
     alias: str
     private: bool
 
+    _annotation_validator: parser.AnnotationValidator
+
     @classmethod
     def from_annotation(
         cls,
@@ -135,7 +152,7 @@ class ModelFieldInfo(FieldInfo):
         validator = parser.get_validator(annotation, model=model)
         validators.append(validator)
 
-        return cls(
+        info = cls(
             default,
             default_factory=default_factory,
             alias=alias,
@@ -143,10 +160,16 @@ class ModelFieldInfo(FieldInfo):
             validators=validators,
             **extra,
         )
+        info._annotation_validator = validator
+        return info
 
     @property
     def annotation_validator(self) -> parser.AnnotationValidator:
         """Return the validator for the annotation."""
+        validator = getattr(self, "_annotation_validator", None)
+        if validator is not None:
+            return validator
+
         return next(validator for validator in self.validators if isinstance(validator, parser.AnnotationValidator))
 
     @property
@@ -6,7 +6,7 @@ import typing
 
 from . import parser, tutils, utility
 
-__all__ = ["generate_models"]
+__all__ = ["generate_models", "generate_models_iter"]
 
 JSONType = typing.Union[None, str, int, float, bool, typing.Sequence["JSONType"], typing.Mapping[str, "JSONType"]]
 RawSchema = typing.Union[
@@ -38,23 +38,60 @@ def to_snake_case(string: str) -> str:
     )
 
 
-def format_field_type(
-    field: typing.Union[str, Field],
-    *,
-    python: typing.Optional[VersionInfo] = None,
-) -> str:
-    """Format a field type."""
-    if isinstance(field, str):
-        return field
+UnionFormatter = typing.Callable[[typing.Sequence[str], bool], str]
+ArrayFormatter = typing.Callable[[str], str]
 
-    assert "type" in field, "Incomplete Field"
+
+def _format_union_pep604(types: typing.Sequence[str], optional: bool) -> str:
+    """Format a union using the `X | Y` syntax."""
+    annotation = " | ".join(types)
+    if optional:
+        annotation += " | None"
+
+    return annotation
+
+
+def _format_union_typing(types: typing.Sequence[str], optional: bool) -> str:
+    """Format a union using `typing.Union` and `typing.Optional`."""
+    if len(types) == 1:
+        annotation = types[0]
+    else:
+        annotation = f"typing.Union[{', '.join(types)}]"
+
+    if optional:
+        annotation = f"typing.Optional[{annotation}]"
+
+    return annotation
+
+
+def _format_array_builtin(annotation: str) -> str:
+    """Format an array using the builtin generic list."""
+    return f"list[{annotation}]"
+
+
+def _format_array_typing(annotation: str) -> str:
+    """Format an array using `typing.Sequence`."""
+    return f"typing.Sequence[{annotation}]"
+
+
+def _get_type_formatters(python: typing.Optional[VersionInfo] = None) -> typing.Tuple[UnionFormatter, ArrayFormatter]:
+    """Get the union and array formatters for a python version."""
     python = python or sys.version_info
 
+    format_union = _format_union_pep604 if python >= (3, 10) else _format_union_typing
+    format_array = _format_array_builtin if python >= (3, 9) else _format_array_typing
+    return format_union, format_array
+
+
+def _format_field_type(field: Field, format_union: UnionFormatter, format_array: ArrayFormatter) -> str:
+    """Format a field type with already resolved formatters."""
+    assert "type" in field, "Incomplete Field"
+
     types: typing.Sequence[str]
     optional: bool = False
 
     if not isinstance(field["type"], str):  # union
-        types, old_types = [x for x in field["type"] if "None" not in x], field["type"]
+        types, old_types = [x for x in field["type"] if x != "None"], field["type"]
         if len(types) != len(old_types):
             optional = True
     elif field["type"] == "None":
@@ -63,28 +100,26 @@ def format_field_type(
     else:
         types = (field["type"],)
 
-    if python >= (3, 10):
-        annotation = " | ".join(types)
-        if optional:
-            annotation += " | None"
-    else:
-        if len(types) == 1:
-            annotation = types[0]
-        else:
-            annotation = f"typing.Union[{', '.join(types)}]"
-
-        if optional:
-            annotation = f"typing.Optional[{annotation}]"
+    annotation = format_union(types, optional)
 
     if field.get("array", False):
-        if python >= (3, 9):
-            annotation = f"list[{annotation}]"
-        else:
-            annotation = f"typing.Sequence[{annotation}]"
+        annotation = format_array(annotation)
 
     return annotation
 
 
+def format_field_type(
+    field: typing.Union[str, Field],
+    *,
+    python: typing.Optional[VersionInfo] = None,
+) -> str:
+    """Format a field type."""
+    if isinstance(field, str):
+        return field
+
+    return _format_field_type(field, *_get_type_formatters(python))
+
+
 def format_field_default(field: Field) -> str:
     """Format a field default."""
     data = {k: v for k, v in field.items() if k not in ("type", "array", "default")}
@@ -174,6 +209,75 @@ def recognize_json_type(value: JSONType) -> RawSchema:
     return type(value).__name__
 
 
+def _add_union_field(
+    schema_name: str,
+    name: str,
+    value: typing.Sequence[RawSchema],
+    schemas: typing.MutableMapping[str, Schema],
+) -> MaybeUnion:
+    """Resolve the type of a union field."""
+    union: typing.Sequence[str] = []
+    for x in value:
+        if isinstance(x, typing.Mapping):
+            unique_name = sys.intern(to_pascal_case(schema_name + "_" + name))
+            add_schema(unique_name, x, schemas)
+            union.append(unique_name)
+        else:
+            if not isinstance(x, str):
+                raise ValueError("Found nesting in the raw schema.")
+
+            union.append(x)
+
+    return join_union(*union)
+
+
+def _add_mapping_field(
+    schema_name: str,
+    name: str,
+    value: typing.Mapping[str, RawSchema],
+    schemas: typing.MutableMapping[str, Schema],
+) -> MaybeUnion:
+    """Resolve the type of a nested schema field."""
+    unique_name = sys.intern(to_pascal_case(schema_name + "_" + name))
+    add_schema(unique_name, value, schemas)
+
+    return unique_name
+
+
+def _add_scalar_field(
+    schema_name: str,
+    name: str,
+    value: str,
+    schemas: typing.MutableMapping[str, Schema],
+) -> MaybeUnion:
+    """Resolve the type of a plain field."""
+    return value
+
+
+FieldTypeHandler = typing.Callable[[str, str, typing.Any, typing.MutableMapping[str, Schema]], MaybeUnion]
+
+_FIELD_TYPE_HANDLERS: typing.Mapping[type, FieldTypeHandler] = {
+    tuple: _add_union_field,
+    list: _add_union_field,
+    dict: _add_mapping_field,
+    str: _add_scalar_field,
+}
+
+
+def _get_field_type_handler(value: RawSchema) -> FieldTypeHandler:
+    """Get the handler resolving the type of a raw schema value."""
+    if handler := _FIELD_TYPE_HANDLERS.get(type(value)):
+        return handler
+
+    # other sequence and mapping implementations
+    if isinstance(value, typing.Sequence) and not isinstance(value, str):
+        return _add_union_field
+    if isinstance(value, typing.Mapping):
+        return _add_mapping_field
+
+    return _add_scalar_field
+
+
 def add_schema(
     schema_name: str,
     raw_schema: typing.Mapping[str, RawSchema],
@@ -185,7 +289,8 @@ def add_schema(
     for name, value in raw_schema.items():
         field: Field = {}
 
-        name, old_name = to_snake_case(name), name
+        # field names repeat heavily across nested schemas
+        name, old_name = sys.intern(to_snake_case(name)), name
         if name != old_name:
             field["alias"] = '"' + old_name + '"'
 
@@ -195,34 +300,12 @@ def add_schema(
             if len(value) == 1:
                 value = value[0]
 
-        if isinstance(value, typing.Sequence) and not isinstance(value, str):
-            union: typing.Sequence[str] = []
-            for x in value:
-                if isinstance(x, typing.Mapping):
-                    unique_name = to_pascal_case(schema_name + "_" + name)
-                    add_schema(unique_name, x, schemas)
-                    union.append(unique_name)
-                else:
-                    if not isinstance(x, str):
-                        raise ValueError("Found nesting in the raw schema.")
-
-                    union.append(x)
-
-            field["type"] = join_union(*union)
-            schema[name] = field
+        field["type"] = _get_field_type_handler(value)(schema_name, name, value, schemas)
+        schema[name] = field
 
-        elif isinstance(value, typing.Mapping):
-            unique_name = to_pascal_case(schema_name + "_" + name)
-            add_schema(unique_name, value, schemas)
-
-            field["type"] = unique_name
-            schema[name] = field
-
-        else:
-            field["type"] = value
-            schema[name] = field
-
-        if "None" in field.get("type", ""):
+        # the type is either a single name or a union of names
+        field_type = field["type"]
+        if field_type == "None" or (not isinstance(field_type, str) and "None" in field_type):
             field["default"] = "None"
 
     if not schema_name:
@@ -244,31 +327,39 @@ def create_schemas(data: JSONType) -> typing.Mapping[str, Schema]:
     return schemas
 
 
-def generate_models(
+def generate_models_iter(
     data: JSONType,
     *,
     python: typing.Optional[VersionInfo] = None,
-) -> str:
-    """Generate model code from data."""
+) -> typing.Iterator[str]:
+    """Generate model code from data piece by piece."""
     schemas = create_schemas(data)
+    format_union, format_array = _get_type_formatters(python)
+
+    yield "import typing\n\nimport apimodel\n\n"
 
-    code = "import typing\n\nimport apimodel\n\n"
+    for index, (schema_name, schema) in enumerate(schemas.items()):
+        if index:
+            yield "\n\n"
 
-    for schema_name, schema in schemas.items():
-        code += f"class {schema_name}(apimodel.APIModel):\n"
+        yield "".join(("class ", schema_name, "(apimodel.APIModel):\n"))
         if len(schema) == 0:
-            code += "    pass\n"
+            yield "    pass\n"
 
         for name, field in schema.items():
-            value = format_field_type(field, python=python)
+            value = _format_field_type(field, format_union, format_array)
             default = format_field_default(field)
 
-            code += f"    {name}: {value}"
             if default:
-                code += " = " + default
+                yield "".join(("    ", name, ": ", value, " = ", default, "\n"))
+            else:
+                yield "".join(("    ", name, ": ", value, "\n"))
 
-            code += "\n"
 
-        code += "\n\n"
-
-    return code.strip() + "\n"
+def generate_models(
+    data: JSONType,
+    *,
+    python: typing.Optional[VersionInfo] = None,
+) -> str:
+    """Generate model code from data."""
+    return "".join(generate_models_iter(data, python=python))
@@ -1,13 +1,14 @@
 """Localization support for the API."""
 from __future__ import annotations
 
-import collections
 import typing
 
 from . import apimodel, fields, tutils
 
 __all__ = ["LocalizedAPIModel", "LocalizedAPIModelMeta", "LocalizedFieldInfo"]
 
+_EMPTY: typing.Mapping[str, str] = {}
+
 
 class LocalizedFieldInfo(fields.ModelFieldInfo):
     """Complete information about a localized field."""
@@ -46,6 +47,17 @@ class LocalizedFieldInfo(fields.ModelFieldInfo):
             **extra,
         )
 
+    def _may_localize(self) -> bool:
+        """Whether the serialized value of the field may be affected by localization."""
+        if self.localizator is not None:
+            return True
+
+        tp = apimodel._get_field_type(self)
+        if tp is None or tp is str:
+            return True
+
+        return tp not in apimodel._SCALAR_TYPES and not tutils.lenient_issubclass(tp, apimodel.APIModel)
+
     def get_localized_name(
         self,
         provider: typing.Mapping[str, typing.Mapping[str, str]],
@@ -56,7 +68,7 @@ class LocalizedFieldInfo(fields.ModelFieldInfo):
         i18n = self.i18n or name or self.alias
 
         if isinstance(i18n, str):
-            return provider[locale].get(i18n, name or self.alias)
+            return provider.get(locale, _EMPTY).get(i18n, name or self.alias)
 
         return i18n[locale]
 
@@ -67,21 +79,45 @@ class LocalizedFieldInfo(fields.ModelFieldInfo):
         locale: str,
     ) -> object:
         """Get the localized value of the field.."""
+        return self._localize_value(value, provider.get(locale, _EMPTY), locale)
+
+    def _localize_value(self, value: object, translations: typing.Mapping[str, str], locale: str) -> object:
+        """Get the localized value of the field from the translations of its locale."""
         if self.localizator is not None:
             return self.localizator(value, locale) or value
 
         if isinstance(value, str):
-            return provider[locale].get(value, value)
+            return translations.get(value, value)
 
         return value
 
 
+class LocalizedFieldsPlan(apimodel.FieldsPlan):
+    """Flattened fields serialized by `LocalizedAPIModel.as_dict`."""
+
+    __slots__ = ("i18n", "localized")
+
+    i18n: typing.Tuple[typing.Optional[typing.Union[str, typing.Mapping[str, str]]], ...]
+    """Localized names declared by the fields."""
+
+    localized: typing.Tuple[typing.Optional[LocalizedFieldInfo], ...]
+    """Fields whose serialized values may be affected by localization. None for all other fields."""
+
+    def __init__(self, items: typing.Sequence[typing.Tuple[str, LocalizedFieldInfo]]) -> None:
+        """Initialize a LocalizedFieldsPlan from ``(attr_name, field)`` items."""
+        super().__init__(items)
+        self.i18n = tuple(field.i18n for _, field in items)
+        self.localized = tuple(field if field._may_localize() else None for _, field in items)
+
+
 class LocalizedAPIModelMeta(apimodel.APIModelMeta):
     """Localized API model metaclass."""
 
     __fields__: typing.Mapping[str, LocalizedFieldInfo]
 
-    i18n: typing.ClassVar[typing.Dict[str, typing.Dict[str, str]]] = collections.defaultdict(dict)
+    _fields_plan_cls: typing.ClassVar[typing.Type[apimodel.FieldsPlan]] = LocalizedFieldsPlan
+
+    i18n: typing.ClassVar[typing.Dict[str, typing.Dict[str, str]]] = {}
     """Internationalization mapping of ``{locale: {key: "localized string"}}``."""
 
     def __new__(
@@ -102,9 +138,27 @@ class LocalizedAPIModelMeta(apimodel.APIModelMeta):
 
         return self
 
+    def _get_fields_plan(self, private: bool = False) -> LocalizedFieldsPlan:
+        """Get the flattened fields to serialize."""
+        return typing.cast("LocalizedFieldsPlan", super()._get_fields_plan(private))
+
+    def _get_localized_names(self, locale: str, *, alias: bool, private: bool) -> typing.List[str]:
+        """Get the localized names of fields in the order of their fields plan.
+
+        Equivalent to `LocalizedFieldInfo.get_localized_name` inlined for every field.
+        """
+        plan = self._get_fields_plan(private)
+        translations = self.i18n.get(locale, _EMPTY)
+
+        # i18n may be changed at any time, names are looked up on every call
+        return [
+            translations.get(i18n or name, name) if not i18n or isinstance(i18n, str) else i18n[locale]
+            for i18n, name in zip(plan.i18n, plan.aliases if alias else plan.names)
+        ]
+
     def set_i18n(self, locale: str, key: str, value: str) -> None:
         """Set a new i18n entry."""
-        self.i18n[locale][key] = value
+        self.i18n.setdefault(locale, {})[key] = value
 
 
 class LocalizedAPIModel(apimodel.APIModel, metaclass=LocalizedAPIModelMeta):
@@ -121,7 +175,6 @@ class LocalizedAPIModel(apimodel.APIModel, metaclass=LocalizedAPIModelMeta):
         properties: bool = True,
         alias: typing.Optional[bool] = None,
         locale: typing.Optional[str] = None,
-        **options: object,
     ) -> typing.Mapping[str, object]:
         """Create a mapping from the model instance.
 
@@ -132,27 +185,27 @@ class LocalizedAPIModel(apimodel.APIModel, metaclass=LocalizedAPIModelMeta):
                 If `False`, do not rename any field even if it can be localized.
             locale: Locale to use for localization. By default the locale of the model instance is used.
         """
-        obj: typing.Mapping[str, object] = {}
-
-        locale = locale or self.locale
-
-        for attr_name, field in self.__class__.__fields__.items():
-            if field.private and not private:
-                continue
-
-            field_name = field.alias if alias else attr_name
-
-            if locale is not None and alias is not False:
-                field_name = field.get_localized_name(self.__class__.i18n, locale, name=field_name)
+        if locale is None:
+            locale = self.locale
 
-            value = apimodel._serialize_attr(getattr(self, attr_name), private=private, alias=alias, locale=locale)
+        cls = type(self)
+        plan = cls._get_fields_plan(private)
+        values = plan.serialize(self, private=private, alias=alias, locale=locale)
 
-            if locale is not None:
-                value = field.get_localized_value(value, self.__class__.i18n, locale)
+        if locale is None:
+            names: typing.Sequence[str] = plan.aliases if alias else plan.names
+        else:
+            translations = cls.i18n.get(locale, _EMPTY)
+            values = [
+                value if field is None else field._localize_value(value, translations, locale)
+                for field, value in zip(plan.localized, values)
+            ]
+            names = plan.names if alias is False else cls._get_localized_names(locale, alias=bool(alias), private=private)
 
-            obj[field_name] = value
+        obj: typing.Dict[str, object] = dict(zip(names, values))
 
         if properties:
-            obj.update({name: getattr(self, attr_name) for attr_name, name in self.__class__.__properties__.items()})
+            for attr_name, name in cls.__properties__.items():
+                obj[name] = getattr(self, attr_name)
 
         return obj
@@ -1,6 +1,7 @@
 """Parser functions for various types."""
 from __future__ import annotations
 
+import collections.abc
 import datetime
 import enum
 import functools
@@ -16,12 +17,34 @@ __all__ = ["acast", "cast", "get_validator", "validate_arguments"]
 T = typing.TypeVar("T")
 
 
+def _cache_hashable(func: typing.Callable[[typing.Any], T]) -> typing.Callable[[typing.Any], T]:
+    """Cache the results of a function of a single argument unless the argument is unhashable."""
+    cached = functools.lru_cache(maxsize=512)(func)
+
+    def wrapper(obj: object) -> T:
+        try:
+            hash(obj)
+        except TypeError:
+            return func(obj)
+
+        return cached(obj)
+
+    return wrapper
+
+
+# callbacks are inspected repeatedly when validators and models get built
+_signature = _cache_hashable(inspect.signature)
+_type_hints = _cache_hashable(typing.get_type_hints)
+
+_UTC = datetime.timezone.utc
+
+
 class AnnotationValidator(validation.Validator):
     """Special validator for annotations."""
 
-    __slots__ = ("tp", "_isasync")
+    __slots__ = ("_tp",)
 
-    tp: object
+    _tp: object
 
     def __init__(self, callback: tutils.AnyCallable, *, isasync: bool = False) -> None:
         """Initialize an AnnotationValidator.
@@ -31,24 +54,49 @@ class AnnotationValidator(validation.Validator):
         super().__init__(callback, order=validation.Order.ANNOTATION)
         self._isasync = isasync
 
-        try:
-            self.tp = typing.get_type_hints(callback)["return"]
-        except Exception:
-            self.tp = object
-
     def __repr_args__(self) -> typing.Mapping[str, object]:
         return {"callback": self.callback}
 
     @property
-    def isasync(self) -> bool:
-        return self._isasync
+    def tp(self) -> object:
+        """Return the validated type. Defaults to the return type of the callback."""
+        # most validators get their type set explicitly
+        try:
+            return self._tp
+        except AttributeError:
+            pass
+
+        annotation = getattr(self.callback, "__annotations__", {}).get("return", object)
+        if isinstance(annotation, str):
+            # forward references must be resolved in the namespace of the callback
+            try:
+                annotation = _type_hints(self.callback)["return"]
+            except Exception:
+                annotation = object
+
+        self._tp = annotation
+        return annotation
+
+    @tp.setter
+    def tp(self, tp: object) -> None:
+        self._tp = tp
+
+
+def _count_parameters(callback: tutils.AnyCallable) -> int:
+    """Count the parameters of a callback as they appear in its signature."""
+    # plain functions do not need a signature to be built
+    if isinstance(callback, types.FunctionType) and not {"__wrapped__", "__signature__"} & callback.__dict__.keys():
+        code = callback.__code__
+        variadic = bool(code.co_flags & inspect.CO_VARARGS) + bool(code.co_flags & inspect.CO_VARKEYWORDS)
+        return code.co_argcount + code.co_kwonlyargcount + variadic
+
+    return len(_signature(callback).parameters)
 
 
 def as_validator(callback: tutils.ValidatorSig, *, isasync: bool = False) -> AnnotationValidator:
     """Convert a validator function to a validator class."""
-    signature = inspect.signature(callback)
     validator = AnnotationValidator(callback, isasync=isasync)
-    if len(signature.parameters) >= 2:
+    if _count_parameters(callback) >= 2:
         validator.bound = True
 
     return validator
@@ -82,32 +130,35 @@ def debuggable_deco(func: tutils.CallableT) -> tutils.CallableT:
 @as_validator
 def datetime_validator(value: typing.Union[datetime.datetime, str, int, float]) -> datetime.datetime:
     """Parse a datetime."""
-    if isinstance(value, datetime.datetime):
-        if value.tzinfo is None:
-            value = value.replace(tzinfo=datetime.timezone.utc)
+    if isinstance(value, str) and value[:4].isdigit() and value[4:5] == "-":
+        # iso dates never parse as unix, skip the failing float conversion
+        # trailing Z is unsupported by the builtin parser before 3.11
+        value = datetime.datetime.fromisoformat(value.rstrip("Z"))
+    elif type(value) is not datetime.datetime and not isinstance(value, datetime.datetime):
+        try:
+            value = float(value)
+        except ValueError:
+            pass
 
-        return value.astimezone(datetime.timezone.utc)
+        if isinstance(value, (int, float)):
+            # attempt to parse unix
+            return datetime.datetime.fromtimestamp(value, tz=_UTC)
 
-    try:
-        value = float(value)
-    except ValueError:
-        pass
+        value = datetime.datetime.fromisoformat(value.rstrip("Z"))
 
-    if isinstance(value, (int, float)):
-        # attempt to parse unix
-        return datetime.datetime.fromtimestamp(value, tz=datetime.timezone.utc)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=_UTC)
+    if value.tzinfo is _UTC:
+        return value
 
-    # unsupported by the builtin parser
-    value = value.rstrip("Z")
-    value = datetime.datetime.fromisoformat(value)
-    return datetime_validator.callback(value)
+    return value.astimezone(_UTC)
 
 
 @as_validator
 def timedelta_validator(value: typing.Union[str, int, float]) -> datetime.timedelta:
     """Parse a timedelta."""
     # TODO: Support ISO8601
-    if isinstance(value, datetime.timedelta):
+    if type(value) is datetime.timedelta or isinstance(value, datetime.timedelta):
         return value
 
     value = float(value)
@@ -137,7 +188,7 @@ def arbitrary_validator(tp: type) -> AnnotationValidator:
 
     @as_validator
     def validator(value: object) -> object:
-        if isinstance(value, tp):
+        if type(value) is tp or isinstance(value, tp):
             return value
 
         raise TypeError(f"Expected {tp}, got {value}")
@@ -148,22 +199,62 @@ def arbitrary_validator(tp: type) -> AnnotationValidator:
 @debuggable_deco
 def literal_validator(*args: object) -> AnnotationValidator:
     """Check if the value is one of the given literals."""
-    values = set(args)
+    values = frozenset(args)
+
+    if len(values) == 1:
+        (expected,) = values
+        message = f"Expected {expected}, got "
+
+        # optional fields only ever check for None
+        if expected is None:
+
+            @as_validator
+            def none_validator(value: object) -> object:
+                if value is None:
+                    return value
+
+                raise TypeError(message + repr(value))
+
+            return none_validator
+
+        @as_validator
+        def single_validator(value: object) -> object:
+            if value is expected or value == expected:
+                return value
+
+            raise TypeError(message + repr(value))
+
+        return single_validator
+
+    message = f"Expected one of {set(values)}, got "
 
     @as_validator
     def validator(value: object) -> object:
         if value in values:
             return value
 
-        if len(values) == 1:
-            (expected,) = values
-            raise TypeError(f"Expected {expected}, got {value!r}")
-        else:
-            raise TypeError(f"Expected one of {values}, got {value!r}")
+        raise TypeError(message + repr(value))
 
     return validator
 
 
+# callbacks defined in these modules never return awaitables unless they are marked as async
+_SYNC_MODULES: typing.Collection[str] = frozenset(("builtins", __name__))
+
+
+def _sync_callback(validator: validation.BaseValidator) -> typing.Callable[[typing.Any, typing.Any], typing.Any]:
+    """Get a plain function calling a synchronous validator with a model and a value."""
+    callback = validator.callback
+    # anything else may still return an awaitable, which synchronous drives to completion
+    if validator.isasync or getattr(callback, "__module__", None) not in _SYNC_MODULES:
+        return validator.synchronous
+
+    if validator.bound:
+        return callback
+
+    return lambda model, value: callback(value)
+
+
 @debuggable_deco
 def enum_validator(enum_type: typing.Type[enum.Enum]) -> AnnotationValidator:
     """Validate an enum."""
@@ -179,11 +270,81 @@ def enum_validator(enum_type: typing.Type[enum.Enum]) -> AnnotationValidator:
     except Exception:
         inner_validator = noop_validator
 
-    async def validator(model: apimodel.APIModel, value: object) -> object:
-        value = await inner_validator(model, value)
-        return typing.cast("enum.Enum", enum_type(value))
+    if inner_validator.isasync:
+
+        async def validator(model: apimodel.APIModel, value: object) -> object:
+            value = await inner_validator(model, value)
+            return typing.cast("enum.Enum", enum_type(value))
+
+        return as_validator(validator, isasync=True)
+
+    inner_callback = _sync_callback(inner_validator)
+
+    def sync_validator(model: apimodel.APIModel, value: object) -> object:
+        return typing.cast("enum.Enum", enum_type(inner_callback(model, value)))
+
+    return as_validator(sync_validator)
+
+
+def _concrete_collection_type(collection_type: typing.Any) -> typing.Any:
+    """Get a concrete collection type for an abstract one."""
+    if not inspect.isabstract(collection_type):
+        return collection_type
 
-    return as_validator(validator, isasync=inner_validator.isasync)
+    if tutils.lenient_issubclass(collection_type, typing.MutableSequence):
+        return list
+    if tutils.lenient_issubclass(collection_type, typing.MutableSet):
+        return set
+    if tutils.lenient_issubclass(collection_type, typing.Set):
+        return frozenset
+
+    return tuple
+
+
+def _validate_items(
+    callback: typing.Callable[[typing.Any, typing.Any], object],
+    model: apimodel.APIModel,
+    value: typing.Iterable[object],
+) -> typing.List[object]:
+    """Validate all items of an iterable and collect their errors."""
+    items: typing.List[object] = []
+    catcher: typing.Optional[errors.ErrorCatcher] = None
+
+    # only create the error catcher once an item fails
+    for index, item in enumerate(value):
+        try:
+            items.append(callback(model, item))
+        except Exception as e:
+            catcher = catcher or errors.ErrorCatcher(model)
+            catcher.add_error(e, loc=index)
+
+    if catcher is not None:
+        catcher.raise_errors()
+
+    return items
+
+
+async def _avalidate_items(
+    validator: validation.Validator,
+    model: apimodel.APIModel,
+    value: typing.Iterable[object],
+) -> typing.List[object]:
+    """Validate all items of an iterable asynchronously and collect their errors."""
+    items: typing.List[object] = []
+    catcher: typing.Optional[errors.ErrorCatcher] = None
+
+    # validators may not be idempotent, so every item is only awaited once
+    for index, item in enumerate(value):
+        try:
+            items.append(await validator(model, item))
+        except Exception as e:
+            catcher = catcher or errors.ErrorCatcher(model)
+            catcher.add_error(e, loc=index)
+
+    if catcher is not None:
+        catcher.raise_errors()
+
+    return items
 
 
 @debuggable_deco
@@ -192,34 +353,47 @@ def collection_validator(
     inner_validator: validation.Validator,
 ) -> AnnotationValidator:
     """Validate the items of a collection."""
-    collection_type = typing.get_origin(collection_type) or collection_type
-
-    if inspect.isabstract(collection_type):
-        if tutils.lenient_issubclass(collection_type, typing.MutableSequence):
-            collection_type = list
-        elif tutils.lenient_issubclass(collection_type, typing.MutableSet):
-            collection_type = set
-        elif tutils.lenient_issubclass(collection_type, typing.Set):
-            collection_type = frozenset
-        else:
-            collection_type = tuple
+    collection_type = _concrete_collection_type(typing.get_origin(collection_type) or collection_type)
 
-    async def validator(model: apimodel.APIModel, value: object) -> typing.Collection[object]:
-        if not tutils.generic_isinstance(value, typing.Iterable[object]):
-            raise TypeError(f"Expected iterable, got {type(value)}")
+    if inner_validator is noop_validator:
+
+        def items_validator(value: object) -> typing.Collection[object]:
+            if not isinstance(value, collections.abc.Iterable):
+                raise TypeError(f"Expected iterable, got {type(value)}")
+
+            return collection_type(value)
+
+        return as_validator(items_validator)
+
+    if inner_validator.isasync:
+
+        async def validator(model: apimodel.APIModel, value: object) -> typing.Collection[object]:
+            if not isinstance(value, collections.abc.Iterable):
+                raise TypeError(f"Expected iterable, got {type(value)}")
 
-        value = value
+            items = await _avalidate_items(inner_validator, model, value)
+            return items if collection_type is list else collection_type(items)
 
-        items: typing.Collection[object] = []
+        return as_validator(validator, isasync=True)
 
-        with errors.catch_errors(model) as catcher:
-            for index, item in enumerate(value):
-                with catcher.catch(loc=index):
-                    items.append((await inner_validator(model, item)))
+    inner_callback = _sync_callback(inner_validator)
+    primitive = _PRIMITIVE_CASTS.get(id(inner_validator))
 
-        return collection_type(items)
+    def sync_validator(model: apimodel.APIModel, value: object) -> typing.Collection[object]:
+        if not isinstance(value, collections.abc.Iterable):
+            raise TypeError(f"Expected iterable, got {type(value)}")
+
+        # builtin casts have no side effects, only they may be retried (iterators cannot be retried at all)
+        if primitive is not None and isinstance(value, (list, tuple)):
+            try:
+                return collection_type(map(primitive, value))
+            except Exception:
+                pass  # collect the errors of all items
+
+        items = _validate_items(inner_callback, model, value)
+        return items if collection_type is list else collection_type(items)
 
-    return as_validator(validator, isasync=inner_validator.isasync)
+    return as_validator(sync_validator)
 
 
 @debuggable_deco
@@ -234,20 +408,86 @@ def mapping_validator(
     if inspect.isabstract(mapping_type):
         mapping_type = dict
 
-    async def validator(model: apimodel.APIModel, value: object) -> object:
-        if not tutils.generic_isinstance(value, typing.Mapping[object, object]):
+    if key_validator.isasync or value_validator.isasync:
+
+        async def validator(model: apimodel.APIModel, value: object) -> object:
+            if not isinstance(value, collections.abc.Mapping):
+                raise TypeError(f"Expected mapping, got {type(value)}")
+
+            mapping: typing.Dict[object, object] = {}
+            catcher: typing.Optional[errors.ErrorCatcher] = None
+
+            for key, item in value.items():
+                try:
+                    mapping[(await key_validator(model, key))] = await value_validator(model, item)
+                except Exception as e:
+                    catcher = catcher or errors.ErrorCatcher(model)
+                    catcher.add_error(e, loc=str(key))
+
+            if catcher is not None:
+                catcher.raise_errors()
+
+            return mapping if mapping_type is dict else mapping_type(mapping)
+
+        return as_validator(validator, isasync=True)
+
+    key_callback = _sync_callback(key_validator)
+    value_callback = _sync_callback(value_validator)
+
+    def sync_validator(model: apimodel.APIModel, value: object) -> object:
+        if not isinstance(value, collections.abc.Mapping):
             raise TypeError(f"Expected mapping, got {type(value)}")
 
-        mapping: typing.Mapping[object, object] = {}
+        mapping: typing.Dict[object, object] = {}
+        catcher: typing.Optional[errors.ErrorCatcher] = None
+
+        # only create the error catcher once an item fails
+        for key, item in value.items():
+            try:
+                mapping[key_callback(model, key)] = value_callback(model, item)
+            except Exception as e:
+                catcher = catcher or errors.ErrorCatcher(model)
+                catcher.add_error(e, loc=str(key))
+
+        if catcher is not None:
+            catcher.raise_errors()
+
+        return mapping if mapping_type is dict else mapping_type(mapping)
+
+    return as_validator(sync_validator)
+
+
+def _make_union_orders(
+    validators: typing.Sequence[validation.Validator],
+) -> typing.Tuple[typing.Mapping[type, typing.Sequence[int]], typing.Sequence[int]]:
+    """Get the order in which union arms are tried by the type of the value and the default order."""
+    default = tuple(range(len(validators)))
+
+    # values of the exact type of the first arms would be validated by them first anyway
+    orders: typing.Dict[type, typing.Sequence[int]] = {}
+    for index, validator in enumerate(validators):
+        if not isinstance(validator, AnnotationValidator):
+            break
+
+        if validator.tp in tutils.NoneTypes:
+            orders[type(None)] = (index,) + default[:index] + default[index + 1 :]
+            continue
+
+        if isinstance(validator.tp, type):
+            orders[validator.tp] = (index,) + default[:index] + default[index + 1 :]
+
+        break
 
-        with errors.catch_errors(model) as catcher:
-            for key in value:
-                with catcher.catch(loc=str(key)):
-                    mapping[(await key_validator(model, key))] = await value_validator(model, value[key])
+    return orders, default
 
-        return mapping_type(mapping)
 
-    return as_validator(validator, isasync=key_validator.isasync or value_validator.isasync)
+def _raise_union_errors(model: apimodel.APIModel, arm_errors: typing.Mapping[int, Exception]) -> None:
+    """Raise the errors of all union arms in their declared order."""
+    catcher = errors.ErrorCatcher(model)
+    for index in sorted(arm_errors):
+        catcher.add_error(arm_errors[index], loc=f"Union[{index}]")
+
+    catcher.raise_errors()
 
 
 @debuggable_deco
@@ -271,15 +511,35 @@ def union_validator(*validators: validation.Validator) -> AnnotationValidator:
 
     del new_validators
 
-    async def validator(model: apimodel.APIModel, value: object) -> object:
-        catcher = errors.ErrorCatcher(model)
-        for index, validator in enumerate(validators):
-            with catcher.catch(loc=f"Union[{index}]"):
-                return await validator(model, value)
+    orders, default_order = _make_union_orders(validators)
 
-        catcher.raise_errors()
+    if any(validator.isasync for validator in validators):
+
+        async def validator(model: apimodel.APIModel, value: object) -> object:
+            arm_errors: typing.Dict[int, Exception] = {}
+            for index in orders.get(type(value), default_order):
+                try:
+                    return await validators[index](model, value)
+                except Exception as e:
+                    arm_errors[index] = e
+
+            _raise_union_errors(model, arm_errors)
+
+        return as_validator(validator, isasync=True)
+
+    callbacks = tuple(_sync_callback(validator) for validator in validators)
 
-    return as_validator(validator, isasync=any(validator.isasync for validator in validators))
+    def sync_validator(model: apimodel.APIModel, value: object) -> object:
+        arm_errors: typing.Dict[int, Exception] = {}
+        for index in orders.get(type(value), default_order):
+            try:
+                return callbacks[index](model, value)
+            except Exception as e:
+                arm_errors[index] = e
+
+        _raise_union_errors(model, arm_errors)
+
+    return as_validator(sync_validator)
 
 
 @debuggable_deco
@@ -289,82 +549,176 @@ def model_validator(model: typing.Type[apimodel.APIModel]) -> AnnotationValidato
     if origin is not None:
         model = typing.cast("type[apimodel.APIModel]", types.new_class(origin.__name__, (model,)))
 
-    async def validator(root: apimodel.APIModel, value: object) -> object:
-        if isinstance(value, model):
+    if model.isasync:
+
+        async def validator(root: apimodel.APIModel, value: object) -> object:
+            if type(value) is model or isinstance(value, model):
+                return value
+
+            if not type(root).__extras__:
+                return await model.create(value)
+
+            return await model.create(value, **root.get_extras())
+
+        return as_validator(validator, isasync=True)
+
+    # the model is known to be synchronous, skip checking it on every instantiation
+    create = model._create_sync
+
+    def sync_validator(root: apimodel.APIModel, value: object) -> object:
+        if type(value) is model or isinstance(value, model):
             return value
 
-        return await model.create(value, **root.get_extras())
+        # most models declare no extras to pass down
+        if not type(root).__extras__:
+            return create(value)
+
+        return create(value, **root.get_extras())
+
+    return as_validator(sync_validator)
+
+
+_FieldEntry = typing.Tuple[str, AnnotationValidator, object]
+
+
+def _make_field_entries(
+    types: typing.Mapping[str, object],
+    fields: typing.Iterable[str],
+    defaults: typing.Mapping[str, object],
+) -> typing.Sequence[_FieldEntry]:
+    """Resolve the validators of fields into ``(field, validator, default)`` tuples."""
+    entries: typing.List[_FieldEntry] = []
+    for field in fields:
+        annotation, default = types.get(field, object), defaults.get(field, ...)
+        # same as model fields
+        if default is None:
+            annotation = typing.Optional[annotation]
+
+        entries.append((field, get_validator(annotation), default))
+
+    return entries
 
-    return as_validator(validator, isasync=model.isasync)
+
+def _get_field_item(items: typing.Mapping[str, object], field: str, default: object) -> object:
+    """Get the raw value of a field or its default."""
+    if field in items:
+        return items[field]
+    if default is not ...:
+        return default
+
+    raise TypeError(f"Missing required field: {field!r}")
+
+
+def _fields_validator(
+    owner: typing.Optional[type],
+    name: str,
+    entries: typing.Sequence[_FieldEntry],
+    to_mapping: typing.Callable[[object], typing.Mapping[str, object]],
+    finalize: typing.Callable[[typing.Dict[str, object]], object],
+) -> AnnotationValidator:
+    """Validate a fixed set of fields without creating a model.
+
+    Errors are reported for the owner of the fields.
+    """
+    if any(field_validator.isasync for _, field_validator, _ in entries):
+
+        async def validator(model: apimodel.APIModel, value: object) -> object:
+            items = to_mapping(value)
+            validated: typing.Dict[str, object] = {}
+
+            with errors.catch_errors(owner, name=name) as catcher:
+                for field, field_validator, default in entries:
+                    with catcher.catch(loc=field):
+                        validated[field] = await field_validator(model, _get_field_item(items, field, default))
+
+            return finalize(validated)
+
+        return as_validator(validator, isasync=True)
+
+    callbacks = [(field, _sync_callback(field_validator), default) for field, field_validator, default in entries]
+
+    def sync_validator(model: apimodel.APIModel, value: object) -> object:
+        items = to_mapping(value)
+        validated: typing.Dict[str, object] = {}
+
+        with errors.catch_errors(owner, name=name) as catcher:
+            for field, callback, default in callbacks:
+                with catcher.catch(loc=field):
+                    validated[field] = callback(model, _get_field_item(items, field, default))
+
+        return finalize(validated)
+
+    return as_validator(sync_validator)
 
 
 @debuggable_deco
 def tuple_validator(tup: typing.Type[typing.Tuple[object, ...]]) -> AnnotationValidator:
     """Validate a namedtuple."""
     if hasattr(tup, "_fields"):
-        name = tup.__name__
         types = getattr(tup, "_field_types", {}) or getattr(tup, "__annotations__", {})
         fields = getattr(tup, "_fields", tuple(types.keys()))
         defaults = getattr(tup, "_field_defaults", {})
     else:
-        name = "Tuple"
         types = {f"field_{i}": x for i, x in enumerate(typing.get_args(tup))}
         fields = tuple(types.keys())
         defaults = {}
 
-    definitions = {name: (types.get(name, object), defaults.get(name, ...)) for name in fields}
-    model = apimodel.create_model(name, **definitions)
-
-    async def validator(value: object) -> typing.Tuple[object, ...]:
-        items: typing.Mapping[str, object]
-
-        if tutils.generic_isinstance(value, typing.Mapping[str, object]):
-            items = value
-        elif tutils.generic_isinstance(value, typing.Iterable[object]):
-            items = dict(zip(fields, value))
+    def to_mapping(value: object) -> typing.Mapping[str, object]:
+        if isinstance(value, collections.abc.Mapping):
+            return value
+        elif isinstance(value, collections.abc.Iterable):
+            return dict(zip(fields, value))
         else:
             raise TypeError(f"Expected iterable, got {type(value)}")
 
-        items = await model.validate(items)
-
+    def to_tuple(items: typing.Mapping[str, object]) -> typing.Tuple[object, ...]:
         if hasattr(tup, "_fields"):
             return tup(**items)
         else:
             tp = typing.get_origin(tup) or tup
             return tp(tuple(items.values()))
 
-    return as_validator(validator, isasync=model.isasync)
+    # plain tuple annotations are not classes, errors used to be reported for a model named Tuple
+    owner, name = (tup, tup.__name__) if isinstance(tup, type) else (None, "Tuple")
+    return _fields_validator(owner, name, _make_field_entries(types, fields, defaults), to_mapping, to_tuple)
 
 
 @debuggable_deco
 def typeddict_validator(typeddict: typing.Type[typing.TypedDict]) -> AnnotationValidator:
     """Validate a typeddict."""
+    types = _type_hints(typeddict)
     required: typing.Collection[str] = getattr(typeddict, "__required_keys__", ())
-    definitions = {
-        name: (tp if required and name in required else (tp, None)) for name, tp in typeddict.__annotations__.items()
-    }
-    model = apimodel.create_model(typeddict.__name__, **definitions)
+    defaults = {name: None for name in types if not (required and name in required)}
 
-    async def validator(value: object) -> object:
-        if not isinstance(value, typing.Mapping):
+    def to_mapping(value: object) -> typing.Mapping[str, object]:
+        if not isinstance(value, collections.abc.Mapping):
             raise TypeError(f"Expected mapping, got {type(value)}")
 
-        value = typing.cast("typing.Mapping[str, object]", value)
+        return typing.cast("typing.Mapping[str, object]", value)
 
-        return await model.validate(value)
+    entries = _make_field_entries(types, types, defaults)
+    return _fields_validator(typeddict, typeddict.__name__, entries, to_mapping, dict)
 
-    return as_validator(validator, isasync=model.isasync)
 
+# the builtin types are unbound callbacks themselves
+_CAST_VALIDATORS: typing.Mapping[typing.Callable[[typing.Any], object], AnnotationValidator] = {
+    tp: AnnotationValidator(tp) for tp in (int, float, str, bytes, bool)
+}
+
+# casts of builtin validators which can be mapped over collections directly
+_PRIMITIVE_CASTS: typing.Mapping[int, typing.Callable[[typing.Any], object]] = {
+    id(validator): tp for tp, validator in _CAST_VALIDATORS.items()
+}
 
 RAW_VALIDATORS: typing.Mapping[object, AnnotationValidator] = {
-    int: cast_validator(int),
-    float: cast_validator(float),
-    str: cast_validator(str),
-    bytes: cast_validator(bytes),
-    bool: cast_validator(bool),
+    **_CAST_VALIDATORS,
     datetime.datetime: datetime_validator,
     datetime.timedelta: timedelta_validator,
     object: noop_validator,
+    list: collection_validator(list, noop_validator),
+    set: collection_validator(set, noop_validator),
+    frozenset: collection_validator(frozenset, noop_validator),
+    dict: mapping_validator(dict, noop_validator, noop_validator),
     None: literal_validator(None),
     type(None): literal_validator(None),
 }
@@ -373,6 +727,11 @@ if not typing.TYPE_CHECKING:
     for tp, validator in RAW_VALIDATORS.items():
         validator.tp = tp
 
+# builtin types are singletons, identity lookups avoid hashing arbitrary annotations
+_RAW_VALIDATORS_BY_ID: typing.Mapping[int, AnnotationValidator] = {
+    id(tp): validator for tp, validator in RAW_VALIDATORS.items()
+}
+
 
 def resolve_typevar(tp: typing.TypeVar, *, model: typing.Optional[type] = None) -> object:
     if model is not None:
@@ -391,23 +750,99 @@ def resolve_typevar(tp: typing.TypeVar, *, model: typing.Optional[type] = None)
         return object
 
 
+def normalize_annotation(tp: object) -> object:
+    """Normalize an annotation into the type to be validated."""
+    # the validated type may itself be annotated
+    while isinstance(tp, tutils.AnnotatedAlias):
+        tp = tp.__metadata__[0] if tp.__metadata__ else tp.__origin__  # type: ignore # compatibility with 3.8
+
+    return tp
+
+
 def _add_tp(callback: tutils.CallableT) -> tutils.CallableT:
     def wrapper(tp: object, *args: object, **kwargs: object) -> object:
-        if isinstance(tp, tutils.AnnotatedAlias):
-            tp = tp.__metadata__[0] if tp.__metadata__ else tp.__origin__  # type: ignore # compatibility with 3.8
+        tp = normalize_annotation(tp)
 
         r = callback(tp, *args, **kwargs)
         assert isinstance(r, AnnotationValidator)
-        r.tp = tp
+        # shared validators already know their type and must not be changed
+        if not hasattr(r, "_tp"):
+            r.tp = tp
 
         return r
 
     return typing.cast("tutils.CallableT", wrapper)
 
 
-@_add_tp
+def _annotation_key(tp: object) -> typing.Tuple[object, ...]:
+    """Make a cache key of an annotation which respects the order of its arguments."""
+    # unions compare equal regardless of the order of their arguments, which changes validation
+    return (tp, tuple(_annotation_key(arg) for arg in typing.get_args(tp)))
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_cached_validator(key: typing.Tuple[object, ...], model: typing.Optional[type]) -> AnnotationValidator:
+    """Get a validator for the annotation of the given key and cache it."""
+    return _build_validator(key[0], model=model)
+
+
 def get_validator(tp: object, *, model: typing.Optional[type] = None) -> AnnotationValidator:
-    """Get a validator for the given type."""
+    """Get a validator for the given type.
+
+    Validators are cached unless the annotation is unhashable.
+    """
+    if validator := _RAW_VALIDATORS_BY_ID.get(id(tp)):
+        return validator
+
+    tp = normalize_annotation(tp)
+
+    # only typevars are resolved using the model
+    if not isinstance(tp, typing.TypeVar) and not getattr(tp, "__parameters__", None):
+        model = None
+
+    key = _annotation_key(tp)
+    try:
+        hash(key)
+    except TypeError:
+        return _build_validator(tp, model=model)
+
+    return _get_cached_validator(key, model)
+
+
+def _build_mapping_validator(
+    origin: type,
+    args: typing.Sequence[object],
+    *,
+    model: typing.Optional[type] = None,
+) -> AnnotationValidator:
+    """Build a validator for a mapping type from its arguments."""
+    key_validator = get_validator(args[0], model=model) if args else noop_validator
+    value_validator = get_validator(args[1], model=model) if args else noop_validator
+    return mapping_validator(origin, key_validator, value_validator)
+
+
+def _build_collection_validator(
+    origin: type,
+    args: typing.Sequence[object],
+    *,
+    model: typing.Optional[type] = None,
+) -> AnnotationValidator:
+    """Build a validator for a collection type from its arguments."""
+    validator = get_validator(args[0], model=model) if args else noop_validator
+    return collection_validator(origin, validator)
+
+
+_ORIGIN_BUILDERS: typing.Mapping[type, typing.Callable[..., AnnotationValidator]] = {
+    list: _build_collection_validator,
+    set: _build_collection_validator,
+    frozenset: _build_collection_validator,
+    dict: _build_mapping_validator,
+}
+
+
+@_add_tp
+def _build_validator(tp: object, *, model: typing.Optional[type] = None) -> AnnotationValidator:
+    """Build a validator for the given type."""
     # TODO: pydantic and dataclasses
     if isinstance(tp, typing.TypeVar):
         tp = resolve_typevar(tp, model=model)
@@ -419,26 +854,29 @@ def get_validator(tp: object, *, model: typing.Optional[type] = None) -> Annotat
         validators = [get_validator(arg, model=model) for arg in args]
         return union_validator(*validators)
 
-    if validator := RAW_VALIDATORS.get(tp):
+    if validator := _RAW_VALIDATORS_BY_ID.get(id(tp)):
         return validator
 
-    if tutils.lenient_issubclass(origin, enum.Enum):
-        return enum_validator(origin)
+    # special forms like Literal are not classes
+    if isinstance(origin, type):
+        # most annotations use the concrete builtin collections
+        if builder := _ORIGIN_BUILDERS.get(origin):
+            return builder(origin, args, model=model)
 
-    if tutils.lenient_issubclass(origin, apimodel.APIModel):
-        return model_validator(typing.cast("type[apimodel.APIModel]", tp))
-    if tutils.lenient_issubclass(origin, tuple) and (not args or args[-1] != ...):
-        return tuple_validator(typing.cast("type[tuple[object, ...]]", tp))
-    if tutils.lenient_issubclass(origin, dict) and hasattr(origin, "__annotations__"):
-        return typeddict_validator(typing.cast("type[typing.TypedDict]", tp))
+        if issubclass(origin, enum.Enum):
+            return enum_validator(origin)
 
-    if tutils.lenient_issubclass(origin, typing.Mapping):
-        key_validator = get_validator(args[0], model=model) if args else noop_validator
-        value_validator = get_validator(args[1], model=model) if args else noop_validator
-        return mapping_validator(origin, key_validator, value_validator)
-    if tutils.lenient_issubclass(origin, typing.Collection):
-        validator = get_validator(args[0], model=model) if args else noop_validator
-        return collection_validator(origin, validator)
+        if issubclass(origin, apimodel.APIModel):
+            return model_validator(typing.cast("type[apimodel.APIModel]", tp))
+        if issubclass(origin, tuple) and (not args or args[-1] != ...):
+            return tuple_validator(typing.cast("type[tuple[object, ...]]", tp))
+        if issubclass(origin, dict) and hasattr(origin, "__annotations__"):
+            return typeddict_validator(typing.cast("type[typing.TypedDict]", tp))
+
+        if issubclass(origin, typing.Mapping):
+            return _build_mapping_validator(origin, args, model=model)
+        if issubclass(origin, typing.Collection):
+            return _build_collection_validator(origin, args, model=model)
 
     if origin == typing.Literal:
         return literal_validator(*args)
@@ -452,6 +890,13 @@ def get_validator(tp: object, *, model: typing.Optional[type] = None) -> Annotat
     raise TypeError(f"Unknown annotation: {tp!r}. Use Annotated[{tp!r}, object] to disable the default validator.")
 
 
+@functools.lru_cache(maxsize=None)
+def _empty_root() -> apimodel.APIModel:
+    """Get a shared model without any fields to pass to validators."""
+    # cannot be created on import because of circular imports
+    return apimodel.APIModel({})
+
+
 # sync is the default since typing.cast() is synchronous too
 # it'd be rare to see a synchronous usage for cast
 
@@ -460,12 +905,44 @@ def get_validator(tp: object, *, model: typing.Optional[type] = None) -> Annotat
 async def acast(tp: typing.Type[T], value: object) -> T:
     """Cast the value to the given type asynchronously."""
     validator = get_validator(tp)
-    return await validator(apimodel.APIModel({}), value)
+    return await validator(_empty_root(), value)
 
 
 def cast(tp: typing.Type[T], value: object) -> T:
     """Cast the value to the given type synchronously."""
-    return acast.synchronous(tp, value)  # type: ignore # issues with comprehending TypeVar
+    validator = get_validator(tp)
+    if validator.isasync:
+        return acast.synchronous(tp, value)  # type: ignore # issues with comprehending TypeVar
+
+    # skip driving a coroutine when nothing can be awaited
+    return _sync_callback(validator)(_empty_root(), value)
+
+
+def _make_binder(
+    signature: inspect.Signature,
+) -> typing.Callable[[typing.Sequence[object], typing.Mapping[str, object]], typing.Mapping[str, object]]:
+    """Make a function binding arguments to their parameter names.
+
+    Arguments are matched to parameters directly and only irregular calls go through `inspect.Signature.bind`.
+    """
+    parameters = signature.parameters.values()
+    names = signature.parameters.keys()
+    positional = tuple(param.name for param in parameters if param.kind is param.POSITIONAL_OR_KEYWORD)
+    required = frozenset(param.name for param in parameters if param.default is param.empty)
+    simple = all(param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY) for param in parameters)
+
+    def bind(args: typing.Sequence[object], kwargs: typing.Mapping[str, object]) -> typing.Mapping[str, object]:
+        if simple and len(args) <= len(positional):
+            arguments = dict(zip(positional, args))
+            if kwargs.keys() <= names and kwargs.keys().isdisjoint(arguments):
+                arguments.update(kwargs)
+                if required <= arguments.keys():
+                    return arguments
+
+        # var-args, positional-only parameters and invalid calls
+        return signature.bind(*args, **kwargs).arguments
+
+    return bind
 
 
 def validate_arguments(callback: typing.Callable[..., T]) -> typing.Callable[..., T]:
@@ -473,25 +950,25 @@ def validate_arguments(callback: typing.Callable[..., T]) -> typing.Callable[...
 
     Inspired by pydantic. Positional-only arguments are not supported because just no.
     """
-    signature = inspect.signature(callback)
+    signature = _signature(callback)
+    bind = _make_binder(signature)
 
-    type_hints = typing.get_type_hints(callback)
-    validators = {name: get_validator(annotation) for name, annotation in type_hints.items()}
+    type_hints = _type_hints(callback)
+    validators = {name: _sync_callback(get_validator(annotation)) for name, annotation in type_hints.items()}
+    return_validator = validators.pop("return", None)
 
     @functools.wraps(callback)
     def wrapper(*args: object, **kwargs: object) -> object:
-        model = apimodel.APIModel({})
+        model = _empty_root()
 
-        bound = signature.bind(*args, **kwargs)
+        arguments = bind(args, kwargs)
         kwargs = {
-            name: validator.synchronous(model, bound.arguments[name])
-            for name, validator in validators.items()
-            if name in bound.arguments
+            name: validator(model, arguments[name]) for name, validator in validators.items() if name in arguments
         }
 
         r = callback(**kwargs)
-        if "return" in validators:
-            r = validators["return"].synchronous(model, r)
+        if return_validator is not None:
+            r = return_validator(model, r)
 
         return r
 
@@ -3,8 +3,10 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import inspect
 import typing
+import weakref
 
 from . import tutils
 
@@ -16,13 +18,19 @@ P = tutils.ParamSpec("P")
 
 def flatten_sequences(*sequences: tutils.MaybeRecursiveSequence[T]) -> typing.Sequence[T]:
     """Flatten a possibly nested sequence."""
-    joined: typing.Sequence[T] = []
+    joined: typing.List[T] = []
 
-    for sequence in sequences:
-        if isinstance(sequence, typing.Sequence) and not isinstance(sequence, str):
-            joined += flatten_sequences(*typing.cast("typing.Sequence[T]", sequence))
+    # walk the nesting with a stack of iterators instead of concatenating recursive results
+    stack: typing.List[typing.Iterator[object]] = [iter(sequences)]
+    while stack:
+        for item in stack[-1]:
+            if type(item) in (list, tuple) or (isinstance(item, typing.Sequence) and not isinstance(item, str)):
+                stack.append(iter(typing.cast("typing.Sequence[object]", item)))
+                break
+
+            joined.append(typing.cast("T", item))
         else:
-            joined.append(typing.cast("T", sequence))
+            stack.pop()
 
     return joined
 
@@ -56,14 +64,24 @@ def devtools_pretty(
         yield ")"
 
 
+def _pretty_signature(
+    name: str,
+    args: typing.Sequence[object],
+    kwargs: typing.Mapping[str, object],
+    fmt: typing.Callable[[object], str],
+    **options: object,
+) -> typing.Iterator[object]:
+    """Devtools pretty formatting of a call."""
+    yield from devtools_pretty(fmt, *args, __name__=name, **kwargs)
+
+
 def make_pretty_signature(name: str, *args: object, **kwargs: object) -> typing.Callable[..., typing.Iterator[object]]:
     """Devtools pretty formatting for a higher order functions."""
+    # called for every built validator, avoid creating a class each time
+    return functools.partial(_pretty_signature, name, args, kwargs)
 
-    class Dummy:
-        def __pretty__(self, fmt: typing.Callable[[object], str], **options: object) -> typing.Iterator[object]:
-            yield from devtools_pretty(fmt, *args, __name__=name, **kwargs)
 
-    return Dummy().__pretty__
+_slots_cache: weakref.WeakKeyDictionary[type, typing.Tuple[str, ...]] = weakref.WeakKeyDictionary()
 
 
 def get_slots(cls: object) -> typing.Collection[str]:
@@ -71,12 +89,22 @@ def get_slots(cls: object) -> typing.Collection[str]:
     if not isinstance(cls, type):
         cls = cls.__class__
 
+    # metaclasses setting slots after creating the class must call forget_slots
+    if (cached := _slots_cache.get(cls)) is not None:
+        return cached
+
     # dict required for ordering
     slots: typing.Dict[str, None] = {}
-    for subclass in reversed(cls.mro()):
+    for subclass in reversed(cls.__mro__):
         slots.update(dict.fromkeys(getattr(subclass, "__slots__", ())))
 
-    return tuple(slots)
+    _slots_cache[cls] = result = tuple(slots)
+    return result
+
+
+def forget_slots(cls: type) -> None:
+    """Forget the cached slots of a class after they have been changed."""
+    _slots_cache.pop(cls, None)
 
 
 def resolve_typevars(cls: type) -> typing.Mapping[str, object]:
@@ -130,11 +158,23 @@ class Representation:
     __slots__ = ()
 
     def __repr_args__(self) -> typing.Mapping[str, object]:
-        args = {k: getattr(self, k) for k in get_slots(self) if hasattr(self, k)}
+        cls = self.__class__
+        repr_slots: typing.Optional[typing.Sequence[str]] = cls.__dict__.get("__repr_slots__")
+        if repr_slots is None:
+            # resolved on first use since metaclasses may still set slots after creating the class
+            repr_slots = tuple(name for name in get_slots(cls) if name[0] != "_")
+            setattr(cls, "__repr_slots__", repr_slots)
+
+        args: typing.Dict[str, object] = {}
+        for k in repr_slots:
+            v = getattr(self, k, Ellipsis)
+            if v is not Ellipsis:
+                args[k] = v
+
         if not args and hasattr(self, "__dict__"):
-            args = self.__dict__
+            return {k: v for k, v in self.__dict__.items() if k[0] != "_" and v is not Ellipsis}
 
-        return {k: v for k, v in args.items() if k[0] != "_" and v != Ellipsis}
+        return args
 
     def __repr__(self) -> str:
         args = ", ".join(f"{k}={v!r}" for k, v in self.__repr_args__().items())
@@ -145,19 +185,69 @@ class Representation:
         yield from devtools_pretty(fmt, __name__=self.__class__.__name__, **self.__repr_args__())
 
 
+def _is_coroutine_function(callback: object) -> bool:
+    """Whether a callback is a coroutine function, checking the code flags of plain functions first."""
+    code = getattr(callback, "__code__", None)
+    if code is not None and code.co_flags & inspect.CO_COROUTINE:
+        return True
+
+    return asyncio.iscoroutinefunction(callback)
+
+
+class _DirectCallback:
+    """Method replaced by a callback stored on the instance if one is set."""
+
+    __slots__ = ("method", "attribute")
+
+    method: typing.Callable[..., object]
+    attribute: str
+
+    def __init__(self, method: typing.Callable[..., object], attribute: str) -> None:
+        self.method = method
+        self.attribute = attribute
+
+    def __get__(self, instance: typing.Optional[object], owner: typing.Optional[type] = None) -> typing.Any:
+        if instance is None:
+            return self.method
+
+        if (callback := getattr(instance, self.attribute)) is not None:
+            return callback
+
+        return self.method.__get__(instance, owner)
+
+
 class UniversalAsync(typing.Generic[P, T]):
     """Compatibility for both sync and async callbacks."""
 
-    __slots__ = ("callback",)
+    __slots__ = ("callback", "_isasync", "_sync_callback", "_async_callback")
 
     callback: typing.Callable[P, tutils.MaybeAwaitable[T]]
 
-    def __init__(self, callback: typing.Callable[P, tutils.MaybeAwaitable[T]]) -> None:
+    _isasync: bool
+    _sync_callback: typing.Optional[typing.Callable[P, T]]
+    _async_callback: typing.Optional[typing.Callable[P, typing.Awaitable[T]]]
+
+    def __init__(
+        self,
+        callback: typing.Callable[P, tutils.MaybeAwaitable[T]],
+        *,
+        isasync: typing.Optional[bool] = None,
+    ) -> None:
         if isinstance(callback, UniversalAsync):
             callback = callback.callback
 
         self.callback = callback
 
+        # binding does not change whether a callback is a coroutine function
+        if isasync is None:
+            isasync = _is_coroutine_function(callback)
+
+        self._isasync = isasync
+        self._async_callback = callback if isasync else None  # type: ignore
+        self._sync_callback = None
+        if not isasync and "async" not in getattr(callback, "__name__", ""):
+            self._sync_callback = callback  # type: ignore
+
     async def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T:
         return await self.asynchronous(*args, **kwargs)
 
@@ -195,17 +285,9 @@ class UniversalAsync(typing.Generic[P, T]):
         return await r
 
     if not typing.TYPE_CHECKING:
-
-        def __getattribute__(self, name: str) -> typing.Any:
-            """Optimize directly getting asynchronous."""
-            if name in ("synchronous", "asynchronous"):
-                isasync = asyncio.iscoroutinefunction(self.callback)
-                if name == "synchronous" and not isasync and "async" not in self.callback.__name__:
-                    return self.callback
-                if name == "asynchronous" and isasync:
-                    return self.callback
-
-            return super().__getattribute__(name)
+        # optimize directly getting the callback without intercepting every other attribute
+        synchronous = _DirectCallback(synchronous, "_sync_callback")
+        asynchronous = _DirectCallback(asynchronous, "_async_callback")
 
     def __pretty__(self, fmt: typing.Callable[[object], str], **kwargs: object) -> typing.Iterator[object]:
         """Devtools pretty formatting."""
@@ -233,7 +315,7 @@ class UniversalAsync(typing.Generic[P, T]):
         owner: typing.Optional[typing.Type[object]],
     ) -> UniversalAsync[..., T]:
         callback = self.callback.__get__(instance, owner)
-        return self.__class__(callback)
+        return self.__class__(callback, isasync=self._isasync)
 
 
 def as_universal(callback: typing.Callable[P, tutils.MaybeAwaitable[T]]) -> UniversalAsync[P, T]:
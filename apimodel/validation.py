@@ -41,13 +41,15 @@ class Order(enum.IntEnum):
 class BaseValidator(utility.Representation):
     """Base class for validators."""
 
-    __slots__ = ("callback", "order", "bound")
+    __slots__ = ("callback", "order", "bound", "_isasync")
 
     callback: tutils.AnyCallable
 
     order: int
     bound: bool
 
+    _isasync: bool
+
     def __init__(self, callback: tutils.AnyCallable, *, order: int) -> None:
         """Initialize a validator.
 
@@ -57,6 +59,7 @@ class BaseValidator(utility.Representation):
         self.order = order
 
         self.bound = False
+        self._isasync = asyncio.iscoroutinefunction(callback)
 
     async def __call__(self, model: object, value: object) -> typing.Any:
         """Call the validator and optionally give it a model."""
@@ -77,7 +80,7 @@ class BaseValidator(utility.Representation):
     @property
     def isasync(self) -> bool:
         """Whether the callback returns an awaitable."""
-        return asyncio.iscoroutinefunction(self.callback)
+        return self._isasync
 
     @property
     def _is_coroutine(self) -> object:
@@ -113,3 +113,19 @@ def test_as_dict(data: typing.Mapping[str, object]) -> None:
             {"username": "baz", "password": "qux", "email": "baz@example.de"},
         ],
     }
+
+
+def test_set_i18n(data: typing.Mapping[str, object]) -> None:
+    model = Model(data, locale="es-es")
+    assert "number" in model.as_dict()
+
+    Model.set_i18n("es-es", "number", "numero")
+    assert "numero" in model.as_dict()
+
+
+def test_mutate_i18n(data: typing.Mapping[str, object]) -> None:
+    model = Model(data, locale="it-it")
+    assert "string" in model.as_dict()
+
+    Model.i18n["it-it"] = {"string": "stringa"}
+    assert "stringa" in model.as_dict()
@@ -40,3 +40,8 @@ def test_nested_generic_models() -> None:
 
     assert model.gen.x == 1
     assert model.gen.y == "2"
+
+
+def test_resolved_typevars_keep_shared_validators() -> None:
+    assert Resolved.__fields__["x"].tp is int
+    assert apimodel.get_validator(int).tp is int
@@ -52,6 +52,28 @@ def test_as_dict(model: apimodel.APIModel) -> None:
     }
 
 
+def test_as_dict_changed_field() -> None:
+    class Changed(apimodel.APIModel):
+        integer: int = 0
+
+    assert Changed().as_dict(alias=True) == {"integer": 0}
+
+    # fields flattened by as_dict must be forgotten once they change
+    field = Changed.__fields__["integer"]
+    field.alias = "number"
+    field.add_validators(apimodel.Validator(lambda value: Inner(required=value), order=apimodel.Order.POST_VALIDATOR))
+
+    assert Changed(number=1).as_dict(alias=True) == {"number": {"required": 1, "optional": None, "magic": 42}}
+
+
+def test_field_type_without_annotation() -> None:
+    # fields may be built directly from validators rather than from an annotation
+    field = apimodel.fields.ModelFieldInfo(validators=[apimodel.parser.get_validator(Inner)])
+
+    assert apimodel.apimodel._get_field_type(field) is Inner
+    assert apimodel.apimodel._get_field_type(apimodel.fields.ModelFieldInfo()) is None
+
+
 def test_get_extras(model: apimodel.APIModel) -> None:
     assert model.get_extras() == {"special": "SPECIAL_DATA"}
 
@@ -108,3 +108,16 @@ class Root(apimodel.APIModel):
     nested_array: list[NestedArray] = apimodel.Field(alias="nestedArray")
 """.lstrip()
     assert code == expected
+
+
+def test_create_schemas_none_substring() -> None:
+    schemas = apimodel.generator.create_schemas({"none_value": {"value": 42}})
+
+    assert schemas["Root"] == {"none_value": {"type": "NoneValue"}}
+
+
+def test_generate_models_iter(json_data: typing.Any) -> None:
+    parts = list(apimodel.generator.generate_models_iter(json_data, python=(3, 8)))
+
+    assert len(parts) > 1
+    assert "".join(parts) == apimodel.generator.generate_models(json_data, python=(3, 8))
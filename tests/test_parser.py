@@ -1,4 +1,5 @@
 import collections
+import dataclasses
 import datetime
 import enum
 import sys
@@ -133,6 +134,20 @@ def test_collection_validator(
     assert apimodel.parser.collection_validator(collection_type, inner_validator).synchronous(model, value) == expected
 
 
+def test_collection_validator_runs_items_once(model: apimodel.APIModel) -> None:
+    calls: typing.List[object] = []
+
+    def callback(value: object) -> int:
+        calls.append(value)
+        return int(value)  # type: ignore
+
+    validator = apimodel.parser.collection_validator(list, apimodel.parser.cast_validator(callback))
+    with pytest.raises(apimodel.ValidationError):
+        validator.synchronous(model, [1, 2, "bad"])
+
+    assert calls == [1, 2, "bad"]
+
+
 @pytest.mark.parametrize(
     ("mapping_type", "key_validator", "value_validator", "value", "expected"),
     [
@@ -157,6 +172,21 @@ def test_mapping_validator(
     assert validator.synchronous(model, value) == expected
 
 
+def test_mapping_validator_runs_items_once(model: apimodel.APIModel) -> None:
+    calls: typing.List[object] = []
+
+    def callback(value: object) -> int:
+        calls.append(value)
+        return int(value)  # type: ignore
+
+    value_validator = apimodel.parser.cast_validator(callback)
+    validator = apimodel.parser.mapping_validator(dict, apimodel.parser.noop_validator, value_validator)
+    with pytest.raises(apimodel.ValidationError):
+        validator.synchronous(model, {"a": 1, "b": "bad"})
+
+    assert calls == [1, "bad"]
+
+
 @pytest.mark.parametrize(
     ("tup", "value", "expected"),
     [
@@ -194,6 +224,22 @@ def test_typeddict(
     assert apimodel.parser.typeddict_validator(typeddict).synchronous(model, value) == expected
 
 
+def test_fields_validator_error_owner(model: apimodel.APIModel) -> None:
+    with pytest.raises(apimodel.ValidationError) as exc_info:
+        apimodel.parser.typeddict_validator(typing.TypedDict("TD", {"x": int})).synchronous(model, {"x": "a"})
+
+    assert exc_info.value.model.__name__ == "TD"
+
+
+def test_tuple_validator_error_name(model: apimodel.APIModel) -> None:
+    with pytest.raises(apimodel.ValidationError) as exc_info:
+        apimodel.parser.tuple_validator(typing.Tuple[int, int]).synchronous(model, ("a", 1))
+
+    assert exc_info.value.model is None
+    assert exc_info.value.name == "Tuple"
+    assert "for Tuple" in str(exc_info.value)
+
+
 @pytest.mark.parametrize(
     ("validators", "value", "expected"),
     [
@@ -210,6 +256,22 @@ def test_union_validator(
     assert apimodel.parser.union_validator(*validators).synchronous(model, value) == expected
 
 
+def test_union_validator_runs_leading_arm_once(model: apimodel.APIModel) -> None:
+    calls: typing.List[object] = []
+
+    def callback(value: object) -> int:
+        calls.append(value)
+        raise ValueError("rejected")
+
+    leading = apimodel.parser.cast_validator(callback)
+    leading.tp = int
+    validator = apimodel.parser.union_validator(leading, apimodel.parser.arbitrary_validator(bytes))
+    with pytest.raises(apimodel.ValidationError):
+        validator.synchronous(model, 42)
+
+    assert calls == [42]
+
+
 @pytest.mark.parametrize(
     ("tp", "value", "expected"),
     [
@@ -237,3 +299,48 @@ def test_tp_retention() -> None:
     field = apimodel.fields.ModelFieldInfo.from_annotation("attr", tp)
 
     assert field.tp is tp
+
+
+def test_get_validator_cache() -> None:
+    tp = typing.Mapping[str, typing.List[int]]
+
+    assert apimodel.get_validator(tp) is apimodel.get_validator(tp)
+    assert apimodel.get_validator(typing.Optional[int]) is apimodel.get_validator(typing.Union[int, None])
+
+
+def test_get_validator_cache_union_order() -> None:
+    assert apimodel.cast(typing.Union[int, str], "5") == 5
+    assert apimodel.cast(typing.Union[str, int], "5") == "5"
+    assert apimodel.cast(typing.List[typing.Union[str, int]], ["5"]) == ["5"]
+
+    assert typing.get_args(apimodel.get_validator(typing.Union[str, int]).tp) == (str, int)
+
+
+def test_unhashable_callback(model: apimodel.APIModel) -> None:
+    @dataclasses.dataclass
+    class Clamp:
+        limit: int
+
+        def __call__(self, value: int) -> int:
+            return min(value, self.limit)
+
+    assert apimodel.parser.as_validator(Clamp(3)).synchronous(model, 5) == 3
+
+
+def test_validate_arguments_annotated() -> None:
+    @apimodel.validate_arguments
+    def function(value: apimodel.tutils.Annotated[int, str]) -> object:
+        return value
+
+    assert function("1") == 1
+
+
+def test_sync_validator_awaitable_callback() -> None:
+    class Validator:
+        async def __call__(self, value: object) -> int:
+            return int(typing.cast(str, value))
+
+    class Number:
+        __validator__ = Validator()
+
+    assert apimodel.parser.cast(typing.List[Number], ["1", "2"]) == [1, 2]